@@ -1,12 +1,36 @@
 """Define some basic classes and functions for use in unit tests."""
 
+import json
 import sys
+from string import ascii_lowercase, ascii_uppercase
+from unittest import TestCase
 
 import fixtures
+import responses
 
 from cert_manager import __version__
 from cert_manager.client import Client
 
+# The base URL of the API used by the default Client
+BASE_URL = "https://certs.example.com/api"
+
+# The Python version included in the user-agent string; it is constant for the process, so build it
+# once here
+PY_VER = ".".join(map(str, sys.version_info[:3]))
+
+# A fake certificate signing request and certificate to use with tests; these never change, so build
+# them once. Each row repeats one letter, and the certificate's rows past "Z" continue in lowercase.
+FAKE_CSR = (
+    "-----BEGIN CERTIFICATE REQUEST-----\n"
+    + "".join(f"{char * 64}\n" for char in ascii_uppercase[:17])
+    + "-----END CERTIFICATE REQUEST-----\n"
+)
+FAKE_CERT = (
+    "-----BEGIN CERTIFICATE-----\n"
+    + "".join(f"{char * 64}\n" for char in ascii_uppercase + ascii_lowercase[:6])
+    + "-----END CERTIFICATE-----\n"
+)
+
 
 # pylint:disable=too-few-public-methods
 # pylint:disable=attribute-defined-outside-init
@@ -17,22 +41,20 @@ class ClientFixture(fixtures.Fixture):
     def _setUp(self):  # noqa: N802
         """Setup the Client object and the values used to build the object."""
         # Setup default testing values
-        self.base_url = "https://certs.example.com/api"
+        self.base_url = BASE_URL
         self.login_uri = "Testing123"
         self.username = "test_user"
         self.password = "test_password"
         self.user_crt_file = "/path/to/pub.key"
         self.user_key_file = "/path/to/priv.key"
 
-        # This is basically the same code as the code used in Client.  This is used just to lock in the
-        # data that the user-agent should have in it.
-        ver_info = list(map(str, sys.version_info))
-        pyver = ".".join(ver_info[:3])
-        self.user_agent = f"cert_manager/{__version__.__version__} (Python {pyver})"
+        # This is basically the same code as the code used in Client. This is used just to lock in
+        # the data that the user-agent should have in it.
+        self.user_agent = f"cert_manager/{__version__.__version__} (Python {PY_VER})"
 
         # Make a Client object
-        self.client = Client(base_url=self.base_url, login_uri=self.login_uri, username=self.username,
-                             password=self.password)
+        self.client = Client(base_url=self.base_url, login_uri=self.login_uri,
+                             username=self.username, password=self.password)
 
         # Headers to check later
         self.headers = {
@@ -43,3 +65,57 @@ class ClientFixture(fixtures.Fixture):
         }
 
         self.addCleanup(delattr, self, "client")
+
+
+class ClientTestCase(TestCase):
+    """Serve as a base class for tests that share a Client fixture and mock requests."""
+
+    @classmethod
+    def setUpClass(cls):  # pylint: disable=invalid-name
+        """Set up the Client fixture and mocked responses shared by every test in the class."""
+        # Call the inherited setUpClass method
+        super().setUpClass()
+
+        cls.cfixt = ClientFixture()
+        cls.cfixt.setUp()
+        cls.client = cls.cfixt.client
+
+        # Patch requests once for the class; each test starts from an empty registry in setUp
+        cls.rsps = responses.RequestsMock(assert_all_requests_are_fired=False)
+        cls.rsps.start()
+
+    @classmethod
+    def tearDownClass(cls):  # pylint: disable=invalid-name
+        """Clean up the shared mocked responses and Client fixture."""
+        cls.rsps.stop()
+        cls.rsps.reset()
+        cls.cfixt.cleanUp()
+
+        # Call the inherited tearDownClass method
+        super().tearDownClass()
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """Initialize the class."""
+        # Call the inherited setUp method
+        super().setUp()
+
+        # Clear any mocked responses and recorded calls left over from the previous test
+        self.rsps.reset()
+
+    def assertJsonBody(self, call, expected):  # noqa: N802 pylint: disable=invalid-name
+        """Assert that the JSON body sent with a mocked call decodes to the expected data.
+
+        :param responses.Call call: The recorded call to check
+        :param dict expected: The data that should have been sent
+        """
+        self.assertEqual(json.loads(call.request.body), expected)
+
+    def assertOneCall(self, url, body=None):  # noqa: N802 pylint: disable=invalid-name
+        """Assert that exactly one mocked call was made to the given URL, optionally with a body.
+
+        :param str url: The URL the call should have been made to
+        :param dict body: The data that should have been sent as JSON; not checked if None
+        """
+        self.assertEqual([call.request.url for call in self.rsps.calls], [url])
+        if body is not None:
+            self.assertJsonBody(self.rsps.calls[0], body)
@@ -132,7 +132,7 @@ class TestACMEAccount(TestCase):  # pylint: disable=too-few-public-methods
         query params contain self.base_params and extra_params.
 
         :param string url: The URL to check
-        :param dict extra_params: The params the query string must contain, in addition to self.base_params
+        :param dict extra_params: The params the query string must contain besides self.base_params
         :param string api_url: Override self.api_url
         """
         api_url = api_url or self.api_url
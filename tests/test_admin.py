@@ -4,78 +4,104 @@
 # pylint: disable=no-member
 
 import json
+from types import MappingProxyType
 
 import responses
 from requests.exceptions import HTTPError
-from testtools import TestCase
+from responses import matchers
 
 from cert_manager.admin import Admin, AdminCreationResponseError
 
-from .lib.testbase import ClientFixture
+from .lib.testbase import ClientTestCase
+
+# Payloads shared by every test are tuples of read-only MappingProxyType views, so no test can
+# modify them in place; the mocked responses use the pre-encoded JSON
+
+# A test response one would expect normally, serialized once so every mocked list request shares it
+_VALID_RESPONSE = (
+    MappingProxyType({
+        "id": 1234, "login": "user1@example.com", "forename": "Test1",
+        "surname": "User1", "email": "user1@example.com"
+    }),
+    MappingProxyType({
+        "id": 4321, "login": "user2@example.com", "forename": "Test2",
+        "surname": "User2", "email": "user2@example.com"
+    }),
+    MappingProxyType({
+        "id": 4322, "login": "user3", "forename": "Test3",
+        "surname": "User3", "email": "user3@example.com"
+    }),
+)
+_VALID_RESPONSE_JSON = json.dumps([dict(admin) for admin in _VALID_RESPONSE]).encode("utf-8")
+
+# A test response for getting a specific Admin; a copy, so the list response is never mutated
+_VALID_INDIVIDUAL_RESPONSE = MappingProxyType({**_VALID_RESPONSE[0], "status": "Active"})
+_VALID_INDIVIDUAL_RESPONSE_JSON = json.dumps(dict(_VALID_INDIVIDUAL_RESPONSE)).encode("utf-8")
+
+# JSON to return in an error
+_ERROR_RESPONSE_JSON = json.dumps({"description": "admin error"}).encode("utf-8")
+
+# A test response for IDPs
+_VALID_IDP_RESPONSE = (
+    MappingProxyType({"id": 12, "name": "Example IDP 1"}),
+    MappingProxyType({"id": 34, "name": "Example IDP 2"}),
+)
+_VALID_IDP_RESPONSE_JSON = json.dumps([dict(idp) for idp in _VALID_IDP_RESPONSE]).encode("utf-8")
+
+# Only match requests without a query string, so a mocked call also verifies the exact URL requested
+_NO_QUERY = matchers.query_param_matcher({})  # pylint: disable=invalid-name
+
+
+class TestAdmin(ClientTestCase):  # pylint: disable=too-few-public-methods
+    """Serve as a Base class for all tests of the Admin class."""
 
+    # The read-only test responses; tests compare decoded lists to them with assertSequenceEqual
+    valid_response = _VALID_RESPONSE
+    valid_individual_response = _VALID_INDIVIDUAL_RESPONSE
+    valid_idp_response = _VALID_IDP_RESPONSE
 
-class TestAdmin(TestCase):  # pylint: disable=too-few-public-methods
-    """Serve as a Base class for all tests of the Admin class."""
+    @classmethod
+    def setUpClass(cls):  # pylint: disable=invalid-name
+        """Set up the mocked responses and objects shared by every test in the class."""
+        # Call the inherited setUpClass method
+        super().setUpClass()
+
+        cls.api_url = f"{cls.cfixt.base_url}/admin/v1"
+
+        # The Admin ID most tests work with, and the URLs used for a single Admin and for IDPs
+        cls.admin_id = 1234
+        cls.admin_url = f"{cls.api_url}/{cls.admin_id}"
+        cls.idp_url = f"{cls.api_url}/idp"
+
+        # An Admin object shared by the tests that do not exercise initialization, so the admin list
+        # is only requested once per class
+        cls.admin = cls._admin()
+
+    @classmethod
+    def _mock_init(cls):
+        """Register the mocked admin list response the Admin class requests when initialized."""
+        cls.rsps.add(responses.GET, cls.api_url, body=_VALID_RESPONSE_JSON,
+                     content_type="application/json", status=200, match=[_NO_QUERY])
 
-    def setUp(self):  # pylint: disable=invalid-name
-        """Initialize the class."""
-        # Call the inherited setUp method
-        super().setUp()
-
-        # Make sure the Client fixture is created and setup
-        self.cfixt = self.useFixture(ClientFixture())
-        self.client = self.cfixt.client
-
-        self.api_url = f"{self.cfixt.base_url}/admin/v1"
-
-        # Setup a test response one would expect normally
-        self.valid_response = [
-            {
-                "id": 1234, "login": "user1@example.com", "forename": "Test1",
-                "surname": "User1", "email": "user1@example.com"
-            },
-            {
-                "id": 4321, "login": "user2@example.com", "forename": "Test2",
-                "surname": "User2", "email": "user2@example.com"
-            },
-            {
-                "id": 4322, "login": "user3", "forename": "Test3",
-                "surname": "User3", "email": "user3@example.com"
-            }
-        ]
-
-        # Setup a test response for getting a specific Admin
-        self.valid_individual_response = self.valid_response[0]
-        self.valid_individual_response["status"] = "Active"
-
-        # Setup a test response for IDPs
-        self.valid_idp_response = [
-            {"id": 12, "name": "Example IDP 1"},
-            {"id": 34, "name": "Example IDP 2"}
-        ]
-
-        # Setup JSON to return in an error
-        self.error_response = {"description": "admin error"}
+    @classmethod
+    def _admin(cls):
+        """Return an Admin object built against the mocked admin list response."""
+        cls._mock_init()
+        return Admin(client=cls.client)
 
 
 class TestInit(TestAdmin):
     """Test the class initializer."""
 
-    @responses.activate
     def test_defaults(self):
         """Parameters should be set correctly inside the class using defaults."""
-        # Setup the mocked response
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-
-        admin = Admin(client=self.client)
+        admin = self._admin()
 
         # Verify all the query information
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.api_url)
+        self.assertEqual(len(self.rsps.calls), 1)
 
-        self.assertEqual(admin._Admin__admins, self.valid_response)
+        self.assertSequenceEqual(admin._Admin__admins, self.valid_response)
 
-    @responses.activate
     def test_param(self):
         """Change the URL if api_version is passed as a parameter."""
         # Set a new version
@@ -83,423 +109,266 @@ class TestInit(TestAdmin):
         api_url = f"{self.cfixt.base_url}/admin/{version}"
 
         # Setup the mocked response
-        responses.add(responses.GET, api_url, json=self.valid_response, status=200)
+        self.rsps.add(responses.GET, api_url, body=_VALID_RESPONSE_JSON,
+                      content_type="application/json", status=200, match=[_NO_QUERY])
 
         admin = Admin(client=self.client, api_version=version)
 
         # Verify all the query information
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, api_url)
+        self.assertEqual(len(self.rsps.calls), 1)
 
-        self.assertEqual(admin._Admin__admins, self.valid_response)
+        self.assertSequenceEqual(admin._Admin__admins, self.valid_response)
 
     def test_need_client(self):
         """Raise an exception if called without a client parameter."""
         self.assertRaises(TypeError, Admin)
 
-    @responses.activate
     def test_bad_http(self):
         """Raise an HTTPError exception if admin accounts cannot be retrieved from the API."""
         # Setup the mocked response
-        responses.add(responses.GET, self.api_url, json=self.error_response, status=400)
+        self.rsps.add(responses.GET, self.api_url, body=_ERROR_RESPONSE_JSON,
+                      content_type="application/json", status=400, match=[_NO_QUERY])
 
         self.assertRaises(HTTPError, Admin, client=self.client)
 
         # Verify all the query information
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.api_url)
+        self.assertEqual(len(self.rsps.calls), 1)
 
 
 class TestAll(TestAdmin):
     """Test the .all method."""
 
-    @responses.activate
     def test_cached(self):
         """Return all the data, but should not query the API twice."""
-        # Setup the mocked response, refrain from matching the query string
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-
-        admin = Admin(client=self.client)
+        admin = self._admin()
         data = admin.all()
 
         # Verify all the query information
         # There should only be one call the first time "all" is called.
         # Due to pagination, this is only guaranteed as long as the number of
         # entries returned is less than the page size
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.api_url)
-        self.assertEqual(data, self.valid_response)
+        self.assertEqual(len(self.rsps.calls), 1)
+        self.assertSequenceEqual(data, self.valid_response)
 
-    @responses.activate
     def test_forced(self):
         """Return all the data, but should query the API twice."""
-        # Setup the mocked response, refrain from matching the query string
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-
-        admin = Admin(client=self.client)
+        admin = self._admin()
         data = admin.all(force=True)
 
         # Verify all the query information
         # There should only be one call the first time "all" is called.
         # Due to pagination, this is only guaranteed as long as the number of
         # entries returned is less than the page size
-        self.assertEqual(len(responses.calls), 2)
-        self.assertEqual(responses.calls[0].request.url, self.api_url)
-        self.assertEqual(responses.calls[1].request.url, self.api_url)
-        self.assertEqual(data, self.valid_response)
+        self.assertEqual(len(self.rsps.calls), 2)
+        self.assertSequenceEqual(data, self.valid_response)
 
 
 class TestGet(TestAdmin):
     """Test the .get method."""
 
-    @responses.activate
     def test_need_admin_id(self):
         """Raise an exception without an admin_id parameter."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-        admin = Admin(client=self.client)
-        self.assertRaises(TypeError, admin.get)
+        self.assertRaises(TypeError, self.admin.get)
 
-    @responses.activate
     def test_admin_id(self):
         """Return data about the specified Admin ID."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-
-        admin_id = 1234
-        api_url = f"{self.api_url}/{str(admin_id)}"
-
         # Setup the mocked response
-        responses.add(responses.GET, api_url, json=self.valid_individual_response, status=200)
+        self.rsps.add(responses.GET, self.admin_url, body=_VALID_INDIVIDUAL_RESPONSE_JSON,
+                      content_type="application/json", status=200, match=[_NO_QUERY])
 
-        admin = Admin(client=self.client)
-        data = admin.get(admin_id)
+        data = self.admin.get(self.admin_id)
 
-        self.assertEqual(len(responses.calls), 2)
-        self.assertEqual(responses.calls[1].request.url, api_url)
+        self.assertEqual(len(self.rsps.calls), 1)
         self.assertEqual(data, self.valid_individual_response)
 
-    @responses.activate
     def test_ne_admin_id(self):
         """Raise an HTTPError exception if the specified Admin ID does not exist."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-
         admin_id = 2345
-        api_url = f"{self.api_url}/{str(admin_id)}"
+        api_url = f"{self.api_url}/{admin_id}"
 
         # Setup the mocked response
-        responses.add(responses.GET, api_url, status=404)
+        self.rsps.add(responses.GET, api_url, status=404)
 
-        admin = Admin(client=self.client)
-        self.assertRaises(HTTPError, admin.get, admin_id)
+        self.assertRaises(HTTPError, self.admin.get, admin_id)
 
 
 class TestGetIdps(TestAdmin):
     """Test the .get_idps method."""
 
-    @responses.activate
     def test_get(self):
         """Return all IDPs."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-
-        api_url = f"{self.api_url}/idp"
-
-        responses.add(responses.GET, api_url, json=self.valid_idp_response, status=200)
+        self.rsps.add(responses.GET, self.idp_url, body=_VALID_IDP_RESPONSE_JSON,
+                      content_type="application/json", status=200, match=[_NO_QUERY])
 
-        admin = Admin(client=self.client)
-        data = admin.get_idps()
+        data = self.admin.get_idps()
 
         # Verify all the query information
         # There should only be one call the first time "all" is called.
         # Due to pagination, this is only guaranteed as long as the number of
         # entries returned is less than the page size
-        self.assertEqual(len(responses.calls), 2)
-        self.assertEqual(responses.calls[1].request.url, api_url)
-        self.assertEqual(data, self.valid_idp_response)
+        self.assertEqual(len(self.rsps.calls), 1)
+        self.assertSequenceEqual(data, self.valid_idp_response)
 
-        responses.add(responses.GET, self.api_url, json=self.error_response, status=400)
-
-    @responses.activate
     def test_get_http_failure(self):
         """Raise an HTTPError exception if IDPs cannot be retrieved from the API."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-
-        api_url = f"{self.api_url}/idp"
-
-        responses.add(responses.GET, api_url, json=self.error_response, status=400)
+        self.rsps.add(responses.GET, self.idp_url, body=_ERROR_RESPONSE_JSON,
+                      content_type="application/json", status=400)
 
-        admin = Admin(client=self.client)
-
-        self.assertRaises(HTTPError, admin.get_idps)
+        self.assertRaises(HTTPError, self.admin.get_idps)
 
 
 class TestCreate(TestAdmin):
     """Test the .create method."""
 
-    @responses.activate
+    # The request bodies are fixed, so define them once for the whole class
+    _CREATE_POST_DATA = {
+        "login": "user1@example.com",
+        "email": "user1@example.com",
+        "forename": "Test1",
+        "surname": "User1",
+        "password": "password",
+        "credentials": [{"role": "DRAO_SSL", "orgId": 123}],
+    }
+
+    _CREATE_OPTIONAL_POST_DATA = {
+        "login": "user1@example.com",
+        "email": "user1@example.com",
+        "forename": "Test1",
+        "surname": "User1",
+        "password": "",
+        "credentials": [{"role": "DRAO_SSL", "orgId": 123}],
+        "identityProviderId": 12,
+        "idpPersonId": "user1@example.com"
+    }
+
     def test_need_params(self):
         """Raise an exception when called without required parameters."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-
-        admin = Admin(client=self.client)
         # Not going to check every permutation of missing parameters,
         # but verify that something is required
-        self.assertRaises(TypeError, admin.create)
+        self.assertRaises(TypeError, self.admin.create)
 
-    @responses.activate
     def test_create_success(self):
         """Return the created admin ID, as well as add all parameters to the request body."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
         # Setup the mocked response
-        admin_id = 1234
-        location = f"{self.api_url}/{str(admin_id)}"
-        responses.add(responses.POST, self.api_url, headers={"Location": location}, status=201)
-
-        admin = Admin(client=self.client)
-        post_data = {
-            "login": "user1@example.com",
-            "email": "user1@example.com",
-            "forename": "Test1",
-            "surname": "User1",
-            "password": "password",
-            "credentials": [{"role": "DRAO_SSL", "orgId": 123}],
-        }
-        response = admin.create(**post_data)
-
-        self.assertEqual(response, {"id": admin_id})
-        self.assertEqual(responses.calls[1].request.body, json.dumps(post_data).encode("utf8"))
-
-    @responses.activate
+        self.rsps.add(responses.POST, self.api_url, headers={"Location": self.admin_url},
+                      status=201)
+
+        response = self.admin.create(**self._CREATE_POST_DATA)
+
+        self.assertEqual(response, {"id": self.admin_id})
+        self.assertJsonBody(self.rsps.calls[0], self._CREATE_POST_DATA)
+
     def test_create_success_optional_params(self):
         """Return the created admin ID when additional params are specified.
 
         Also, add the non-required parameters to the request body.
         """
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
         # Setup the mocked response
-        admin_id = 1234
-        location = f"{self.api_url}/{str(admin_id)}"
-        responses.add(responses.POST, self.api_url, headers={"Location": location}, status=201)
-
-        admin = Admin(client=self.client)
-        post_data = {
-            "login": "user1@example.com",
-            "email": "user1@example.com",
-            "forename": "Test1",
-            "surname": "User1",
-            "password": "",
-            "credentials": [{"role": "DRAO_SSL", "orgId": 123}],
-            "identityProviderId": 12,
-            "idpPersonId": "user1@example.com"
-        }
-        response = admin.create(**post_data)
-
-        self.assertEqual(response, {"id": admin_id})
-        self.assertEqual(responses.calls[1].request.body, json.dumps(post_data).encode("utf8"))
-
-    @responses.activate
-    def test_create_failure_http_error(self):
-        """Return an error code and description if the Admin creation failed."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-        # Setup the mocked response
-        responses.add(responses.POST, self.api_url, json=self.error_response,
-                      status=400)
-
-        admin = Admin(client=self.client)
-
-        create_args = {
-            "login": "user1@example.com",
-            "email": "user1",  # This would be a malformed email and would throw a 400 error from the API
-            "forename": "Test1",
-            "surname": "User1",
-            "password": "password",
-            "credentials": [{"role": "DRAO_SSL", "orgId": 123}],
-        }
-        self.assertRaises(ValueError, admin.create, **create_args)
-
-    @responses.activate
-    def test_create_failure_http_status_unexpected(self):
-        """Raise an exception if the Admin creation fails with unexpected http code."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-        # Setup the mocked response
-        responses.add(responses.POST, self.api_url, json=self.error_response,
-                      status=200)
-
-        admin = Admin(client=self.client)
-
-        create_args = {
-            "login": "user1@example.com",
-            "email": "user1@example.com",
-            "forename": "Test1",
-            "surname": "User1",
-            "password": "password",
-            "credentials": [{"role": "DRAO_SSL", "orgId": 123}],
-        }
-        self.assertRaises(AdminCreationResponseError, admin.create, **create_args)
-
-    @responses.activate
-    def test_create_failure_missing_location_header(self):
-        """Raise an exception if the Admin creation fails due to no Location header in response."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-        # Setup the mocked response
-        responses.add(responses.POST, self.api_url, status=201)
-
-        admin = Admin(client=self.client)
-
-        create_args = {
-            "login": "user1@example.com",
-            "email": "user1@example.com",
-            "forename": "Test1",
-            "surname": "User1",
-            "password": "password",
-            "credentials": [{"role": "DRAO_SSL", "orgId": 123}],
-        }
-        self.assertRaises(AdminCreationResponseError, admin.create, **create_args)
-
-    @responses.activate
-    def test_create_failure_admin_id_not_found(self):
-        """Raise an exception if the Admin creation fails because Admin ID not found in response."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-        # Setup the mocked response
-        responses.add(responses.POST, self.api_url, headers={"Location": "not a url"}, status=201)
-
-        admin = Admin(client=self.client)
-
-        create_args = {
-            "login": "user1@example.com",
-            "email": "user1@example.com",
-            "forename": "Test1",
-            "surname": "User1",
-            "password": "password",
-            "credentials": [{"role": "DRAO_SSL", "orgId": 123}],
-        }
-        self.assertRaises(AdminCreationResponseError, admin.create, **create_args)
+        self.rsps.add(responses.POST, self.api_url, headers={"Location": self.admin_url},
+                      status=201)
+
+        response = self.admin.create(**self._CREATE_OPTIONAL_POST_DATA)
+
+        self.assertEqual(response, {"id": self.admin_id})
+        self.assertJsonBody(self.rsps.calls[0], self._CREATE_OPTIONAL_POST_DATA)
+
+    def test_create_failure(self):
+        """Raise an exception if the Admin creation fails."""
+        failures = (
+            # Return an error code and description if the Admin creation failed; the malformed email
+            # would throw a 400 error from the API
+            (
+                {"body": _ERROR_RESPONSE_JSON, "content_type": "application/json", "status": 400},
+                {"email": "user1"},
+                ValueError,
+            ),
+            # Raise an exception if the Admin creation fails with unexpected http code
+            (
+                {"body": _ERROR_RESPONSE_JSON, "content_type": "application/json", "status": 200},
+                {},
+                AdminCreationResponseError,
+            ),
+            # Raise an exception if the Admin creation fails due to no Location header in response
+            ({"status": 201}, {}, AdminCreationResponseError),
+            # Raise an exception if the Admin creation fails because Admin ID not found in response
+            ({"headers": {"Location": "not a url"}, "status": 201}, {}, AdminCreationResponseError),
+        )
+
+        for mock_args, create_args, exception in failures:
+            with self.subTest(mock_args=mock_args):
+                # Setup the mocked response
+                self.rsps.reset()
+                self.rsps.add(responses.POST, self.api_url, **mock_args)
+
+                self.assertRaises(exception, self.admin.create,
+                                  **{**self._CREATE_POST_DATA, **create_args})
 
 
 class TestDelete(TestAdmin):
     """Test the .delete method."""
 
-    @responses.activate
     def test_need_params(self):
         """Raise an exception when called without required parameters."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-
-        admin = Admin(client=self.client)
         # missing admin_id
-        self.assertRaises(TypeError, admin.delete)
+        self.assertRaises(TypeError, self.admin.delete)
 
-    @responses.activate
     def test_delete_success(self):
         """Return True if the deletion succeeded."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-
-        admin_id = 1234
-        api_url = f"{self.api_url}/{str(admin_id)}"
-
         # Setup the mocked response
-        responses.add(responses.DELETE, api_url, status=204)
+        self.rsps.add(responses.DELETE, self.admin_url, status=204)
 
-        admin = Admin(client=self.client)
-        response = admin.delete(admin_id)
+        response = self.admin.delete(self.admin_id)
 
         self.assertEqual(True, response)
 
-    @responses.activate
     def test_delete_failure_http_error(self):
         """Raise an HTTPError exception if the deletion failed."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-
-        admin_id = 1234
-        api_url = f"{self.api_url}/{str(admin_id)}"
-
         # Setup the mocked response
-        responses.add(responses.DELETE, api_url, status=404)
+        self.rsps.add(responses.DELETE, self.admin_url, status=404)
 
-        admin = Admin(client=self.client)
-
-        self.assertRaises(HTTPError, admin.delete, admin_id)
+        self.assertRaises(HTTPError, self.admin.delete, self.admin_id)
 
 
 class TestUpdate(TestAdmin):
     """Test the .update method."""
 
-    @responses.activate
+    # The request body is fixed, so define it once for the whole class
+    _UPDATE_POST_DATA = {
+        "forename": "Test1",
+        "surname": "User1",
+    }
+
     def test_need_params(self):
         """Raise an exception when called without required parameters."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-
-        admin = Admin(client=self.client)
         # missing admin_id
-        self.assertRaises(TypeError, admin.update)
+        self.assertRaises(TypeError, self.admin.update)
 
-    @responses.activate
     def test_update_success(self):
         """Return True if the update succeeded."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-
-        admin_id = 1234
-        api_url = f"{self.api_url}/{str(admin_id)}"
-
         # Setup the mocked response
-        responses.add(responses.PUT, api_url, status=200)
+        self.rsps.add(responses.PUT, self.admin_url, status=200)
 
-        admin = Admin(client=self.client)
-        response = admin.update(admin_id)
+        response = self.admin.update(self.admin_id)
 
         self.assertEqual(True, response)
 
-    @responses.activate
     def test_update_body_success(self):
         """Additional **kwargs should be added to request body."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-
-        admin_id = 1234
-        api_url = f"{self.api_url}/{str(admin_id)}"
-
         # Setup the mocked response
-        responses.add(responses.PUT, api_url, status=200)
-
-        admin = Admin(client=self.client)
+        self.rsps.add(responses.PUT, self.admin_url, status=200)
 
-        post_data = {
-            "forename": "Test1",
-            "surname": "User1",
-        }
-        response = admin.update(admin_id, **post_data)
+        response = self.admin.update(self.admin_id, **self._UPDATE_POST_DATA)
 
         self.assertEqual(True, response)
-        self.assertEqual(responses.calls[1].request.body, json.dumps(post_data).encode("utf8"))
+        self.assertJsonBody(self.rsps.calls[0], self._UPDATE_POST_DATA)
 
-    @responses.activate
     def test_update_failure_http_error(self):
         """Return an error code and description if the Admin creation failed."""
-        # Setup the mocked response when class is initialized
-        responses.add(responses.GET, self.api_url, json=self.valid_response, status=200)
-
-        admin_id = 1234
-        api_url = f"{self.api_url}/{str(admin_id)}"
-
         # Setup the mocked response
-        responses.add(responses.PUT, api_url, json=self.error_response, status=400)
-
-        admin = Admin(client=self.client)
+        self.rsps.add(responses.PUT, self.admin_url, body=_ERROR_RESPONSE_JSON,
+                      content_type="application/json", status=400)
 
-        update_args = {"email": "user1@example.com"}  # This malformed email would return an error from the API
+        # This malformed email would return an error from the API
+        update_args = {"email": "user1@example.com"}
 
-        self.assertRaises(ValueError, admin.update, admin_id, **update_args)
+        self.assertRaises(ValueError, self.admin.update, self.admin_id, **update_args)
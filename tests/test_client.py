@@ -7,35 +7,49 @@
 # https://stackoverflow.com/questions/9323749/python-check-if-one-dictionary-is-a-subset-of-another-larger-dictionary
 #
 
-import sys
-from unittest import mock
+from urllib.parse import parse_qs, urlsplit
 
 import responses
 from requests.exceptions import HTTPError
-from testtools import TestCase
 
+from cert_manager import __version__
 from cert_manager.client import Client
 
-from .lib.testbase import ClientFixture
+from .lib.testbase import BASE_URL, PY_VER, ClientTestCase
 
+# An example URL, and the data and extra headers sent to and returned from it, for the request
+# tests; tests only read these, so they are shared
+_TEST_URL = f"{BASE_URL}/test/url"
+_GET_DATA = {"some": "data"}
+_ERROR_DATA = {"description": "some error"}
+_INPUT_DATA = {"input": "data"}
+_OUTPUT_DATA = {"output": "data"}
+_EXTRA_HEADERS = {"newheader": "123"}
 
-class TestClient(TestCase):  # pylint: disable=too-few-public-methods
+# The certificate download types hard-coded into Client
+_DOWNLOAD_TYPES = ("base64", "bin", "x509", "x509CO", "x509IO", "x509IOR")
+
+
+class TestClient(ClientTestCase):  # pylint: disable=too-few-public-methods
     """Serve as a Base class for all tests of the Client class."""
 
-    def setUp(self):  # pylint: disable=invalid-name
-        """Initialize the class."""
-        # Call the inherited setUp method
-        super().setUp()
+    @classmethod
+    def setUpClass(cls):  # pylint: disable=invalid-name
+        """Set up the header values shared by every test in the class."""
+        # Call the inherited setUpClass method
+        super().setUpClass()
 
-        # Use the Client fixture
-        self.cfixt = self.useFixture(ClientFixture())
-        self.client = self.cfixt.client
+        # The (header, value) pairs every Client built from the fixture values should send
+        cls.header_items = frozenset(cls.cfixt.headers.items())
 
-    def tearDown(self):  # pylint: disable=invalid-name
-        """Test tear down method."""
-        super().tearDown()
+    def restore_headers(self):
+        """Restore the shared Client's headers when the current test finishes.
 
-        mock.patch.stopall()
+        add_headers replaces the Client's header dictionary while remove_headers changes it in
+        place, so copies of both it and the Session headers are put back.
+        """
+        self.addCleanup(setattr, self.client, "_Client__headers", self.client.headers.copy())
+        self.addCleanup(setattr, self.client.session, "headers", self.client.session.headers.copy())
 
 
 class TestTypes(TestClient):
@@ -43,9 +57,7 @@ class TestTypes(TestClient):
 
     def test_types(self):
         """Certificate types need to be hard-coded into Client currently."""
-        default_types = ["base64", "bin", "x509", "x509CO", "x509IO", "x509IOR"]
-
-        self.assertEqual(default_types, self.client.DOWNLOAD_TYPES)
+        self.assertEqual(tuple(self.client.DOWNLOAD_TYPES), _DOWNLOAD_TYPES)
 
 
 class TestInit(TestClient):
@@ -53,7 +65,8 @@ class TestInit(TestClient):
 
     def test_defaults(self):
         """Set parameters correctly inside the class using defaults."""
-        client = Client(login_uri=self.cfixt.login_uri, username=self.cfixt.username, password=self.cfixt.password)
+        client = Client(login_uri=self.cfixt.login_uri, username=self.cfixt.username,
+                        password=self.cfixt.password)
 
         # Use the hackity object mangling when dealing with double-underscore values in an object
         # This hard-coded test is to test that the default base_url is used when none is provided
@@ -63,21 +76,15 @@ class TestInit(TestClient):
         self.assertEqual(client._Client__password, self.cfixt.password)
         self.assertEqual(client._Client__cert_auth, False)
 
-        # Make sure all the headers make their way into the internal requests.Session object
-        for head, headdata in self.cfixt.headers.items():
-            self.assertTrue(head in client._Client__session.headers)
-            self.assertEqual(client._Client__session.headers[head], headdata)
-
         # Because password was used and cert_auth was False, a password header should exist
-        self.assertTrue("password" in client._Client__session.headers)
-        self.assertEqual(self.cfixt.password, client._Client__session.headers["password"])
+        self.assertEqual(client._Client__session.headers["password"], self.cfixt.password)
 
     def test_params(self):
         """Set parameters correctly inside the class using all parameters."""
         client = Client(
-            base_url=self.cfixt.base_url, login_uri=self.cfixt.login_uri, username=self.cfixt.username,
-            password=self.cfixt.password, cert_auth=True, user_crt_file=self.cfixt.user_crt_file,
-            user_key_file=self.cfixt.user_key_file,
+            base_url=self.cfixt.base_url, login_uri=self.cfixt.login_uri,
+            username=self.cfixt.username, password=self.cfixt.password, cert_auth=True,
+            user_crt_file=self.cfixt.user_crt_file, user_key_file=self.cfixt.user_key_file,
         )
 
         # Use the hackity object mangling when dealing with double-underscore values in an object
@@ -87,20 +94,17 @@ class TestInit(TestClient):
         self.assertEqual(client._Client__cert_auth, True)
         self.assertEqual(client._Client__user_crt_file, self.cfixt.user_crt_file)
         self.assertEqual(client._Client__user_key_file, self.cfixt.user_key_file)
-        self.assertEqual(client._Client__session.cert, (self.cfixt.user_crt_file, self.cfixt.user_key_file))
-
-        # Make sure all the headers make their way into the internal requests.Session object
-        for head, headdata in self.cfixt.headers.items():
-            self.assertTrue(head in client._Client__session.headers)
-            self.assertEqual(client._Client__session.headers[head], headdata)
+        self.assertEqual(client._Client__session.cert,
+                         (self.cfixt.user_crt_file, self.cfixt.user_key_file))
 
         # If cert_auth is True, make sure a password header does not exist
-        self.assertFalse("password" in client._Client__session.headers)
+        self.assertNotIn("password", client._Client__session.headers)
 
     def test_no_pass_with_certs(self):
         """Set parameters correctly inside the class certificate auth without a password."""
         client = Client(
-            base_url=self.cfixt.base_url, login_uri=self.cfixt.login_uri, username=self.cfixt.username, cert_auth=True,
+            base_url=self.cfixt.base_url, login_uri=self.cfixt.login_uri,
+            username=self.cfixt.username, cert_auth=True,
             user_crt_file=self.cfixt.user_crt_file, user_key_file=self.cfixt.user_key_file,
         )
 
@@ -111,67 +115,73 @@ class TestInit(TestClient):
         self.assertEqual(client._Client__cert_auth, True)
         self.assertEqual(client._Client__user_crt_file, self.cfixt.user_crt_file)
         self.assertEqual(client._Client__user_key_file, self.cfixt.user_key_file)
-        self.assertEqual(client._Client__session.cert, (self.cfixt.user_crt_file, self.cfixt.user_key_file))
-
-        # Make sure all the headers make their way into the internal requests.Session object
-        for head, headdata in self.cfixt.headers.items():
-            self.assertTrue(head in client._Client__session.headers)
-            self.assertEqual(client._Client__session.headers[head], headdata)
+        self.assertEqual(client._Client__session.cert,
+                         (self.cfixt.user_crt_file, self.cfixt.user_key_file))
 
         # If cert_auth is True, make sure a password header does not exist
-        self.assertFalse("password" in client._Client__session.headers)
+        self.assertNotIn("password", client._Client__session.headers)
+
+    def test_headers(self):
+        """Send all the fixture headers through the internal requests.Session object."""
+        # Build the Client with password authentication, certificate authentication, and both
+        cert_kwargs = {
+            "cert_auth": True,
+            "user_crt_file": self.cfixt.user_crt_file,
+            "user_key_file": self.cfixt.user_key_file,
+        }
+        auths = (
+            ("password", {"password": self.cfixt.password}),
+            ("certificate", cert_kwargs),
+            ("certificate with password", {"password": self.cfixt.password, **cert_kwargs}),
+        )
+        for name, kwargs in auths:
+            with self.subTest(auth=name):
+                client = Client(
+                    base_url=self.cfixt.base_url, login_uri=self.cfixt.login_uri,
+                    username=self.cfixt.username, **kwargs,
+                )
+
+                self.assertLessEqual(self.header_items, client._Client__session.headers.items())
 
     def test_versioning(self):
         """Change the user-agent header if the version number changes."""
         test_version = "10.9.8"
-        ver_info = list(map(str, sys.version_info))
-        pyver = ".".join(ver_info[:3])
-        user_agent = f"cert_manager/{test_version} (Python {pyver})"
+        user_agent = f"cert_manager/{test_version} (Python {PY_VER})"
 
-        ver_patcher = mock.patch("cert_manager.__version__.__version__", test_version)
-        ver_patcher.start()
+        # Swap the version string in for this test only
+        self.addCleanup(setattr, __version__, "__version__", __version__.__version__)
+        __version__.__version__ = test_version
 
-        client = Client(login_uri=self.cfixt.login_uri, username=self.cfixt.username, password=self.cfixt.password)
+        client = Client(login_uri=self.cfixt.login_uri, username=self.cfixt.username,
+                        password=self.cfixt.password)
 
-        # Make sure the user-agent header is correct in the class and the internal requests.Session object
+        # Make sure the user-agent header is correct in the class and the internal Session object
         self.assertEqual(client.headers["User-Agent"], user_agent)
         self.assertEqual(client._Client__session.headers["User-Agent"], user_agent)
 
-    def test_need_crt(self):
-        """Raise an exception without a cert file if cert_auth=True."""
-        self.assertRaises(KeyError, Client, base_url=self.cfixt.base_url, login_uri=self.cfixt.login_uri,
-                          username=self.cfixt.username, cert_auth=True, user_key_file=self.cfixt.user_key_file)
-
-    def test_need_key(self):
-        """Raise an exception without a key file if cert_auth=True."""
-        self.assertRaises(KeyError, Client, base_url=self.cfixt.base_url, login_uri=self.cfixt.login_uri,
-                          username=self.cfixt.username, cert_auth=True, user_crt_file=self.cfixt.user_crt_file)
-
-    def test_need_login_uri(self):
-        """Raise an exception without a login_uri."""
-        self.assertRaises(KeyError, Client, username=self.cfixt.username, password=self.cfixt.password)
-
-    def test_need_username(self):
-        """Raise an exception without a username."""
-        self.assertRaises(KeyError, Client, login_uri=self.cfixt.login_uri, password=self.cfixt.password)
-
-    def test_need_password(self):
-        """Raise an exception without a password."""
-        self.assertRaises(KeyError, Client, login_uri=self.cfixt.login_uri, username=self.cfixt.username)
-
-    def test_need_public_key(self):
-        """Raise an exception without a public key if cert_auth is enabled."""
-        self.assertRaises(
-            KeyError, Client, login_uri=self.cfixt.login_uri, username=self.cfixt.username,
-            password=self.cfixt.password, cert_auth=True, user_key_file=self.cfixt.user_key_file,
+    def test_missing_required_args(self):
+        """Raise a KeyError if a required argument is missing."""
+        base = {"login_uri": self.cfixt.login_uri, "username": self.cfixt.username}
+        cert = {**base, "base_url": self.cfixt.base_url, "cert_auth": True}
+        passwd = {**base, "password": self.cfixt.password, "cert_auth": True}
+        missing_args = (
+            ({**cert, "user_key_file": self.cfixt.user_key_file}, "user_crt_file"),
+            ({**cert, "user_crt_file": self.cfixt.user_crt_file}, "user_key_file"),
+            ({"username": self.cfixt.username, "password": self.cfixt.password}, "login_uri"),
+            ({"login_uri": self.cfixt.login_uri, "password": self.cfixt.password}, "username"),
+            (base, "password"),
+            # Certificate auth still needs both files even if a password is passed
+            ({**passwd, "user_key_file": self.cfixt.user_key_file}, "user_crt_file"),
+            ({**passwd, "user_crt_file": self.cfixt.user_crt_file}, "user_key_file"),
         )
 
-    def test_need_private_key(self):
-        """Raise an exception without a private key if cert_auth is enabled."""
-        self.assertRaises(
-            KeyError, Client, login_uri=self.cfixt.login_uri, username=self.cfixt.username,
-            password=self.cfixt.password, cert_auth=True, user_crt_file=self.cfixt.user_crt_file,
-        )
+        for kwargs, missing in missing_args:
+            with self.subTest(missing=missing, kwargs=kwargs):
+                with self.assertRaises(KeyError) as ctx:
+                    Client(**kwargs)
+
+                # Make sure the error is about the argument that was left out, not some other one
+                self.assertEqual(ctx.exception.args[0], missing)
 
 
 class TestProperties(TestClient):
@@ -183,13 +193,11 @@ class TestProperties(TestClient):
 
     def test_headers(self):
         """The headers property should return the correct value."""
-        client = Client(login_uri=self.cfixt.login_uri, username=self.cfixt.username, password=self.cfixt.password)
-
-        headers = self.cfixt.headers.copy()
-        headers["password"] = self.cfixt.password
+        headers = {**self.cfixt.headers, "password": self.cfixt.password}
 
-        # Since we initialized with a username/password, the password header will need to exist as well
-        self.assertEqual(client.headers, headers)
+        # Since the shared Client was initialized with a username/password, the password header will
+        # need to exist as well
+        self.assertEqual(self.client.headers, headers)
 
     def test_session(self):
         """The session property should return the correct value."""
@@ -199,6 +207,13 @@ class TestProperties(TestClient):
 class TestAddHeaders(TestClient):
     """Test the add_headers method."""
 
+    def setUp(self):  # pylint: disable=invalid-name
+        """Initialize the class."""
+        # Call the inherited setUp method
+        super().setUp()
+
+        self.restore_headers()
+
     def test_add(self):
         """The extra headers should be added correctly."""
         headers = {"Connection": "close"}
@@ -206,14 +221,10 @@ class TestAddHeaders(TestClient):
         self.client.add_headers(headers)
 
         # Make sure the new headers make their way into the internal requests.Session object
-        for header, hval in headers.items():
-            self.assertTrue(header in self.client._Client__session.headers)
-            self.assertEqual(hval, self.client._Client__session.headers[header])
+        self.assertLessEqual(headers.items(), self.client._Client__session.headers.items())
 
         # Make sure the original headers are still in the internal requests.Session object
-        for head, headdata in self.cfixt.headers.items():
-            self.assertTrue(head in self.client._Client__session.headers)
-            self.assertEqual(self.client._Client__session.headers[head], headdata)
+        self.assertLessEqual(self.header_items, self.client._Client__session.headers.items())
 
     def test_replace(self):
         """The already existing header should be modified."""
@@ -222,16 +233,12 @@ class TestAddHeaders(TestClient):
         self.client.add_headers(headers)
 
         # Make sure the new headers make their way into the internal requests.Session object
-        for header, hval in headers.items():
-            self.assertTrue(header in self.client._Client__session.headers)
-            self.assertEqual(hval, self.client._Client__session.headers[header])
+        self.assertLessEqual(headers.items(), self.client._Client__session.headers.items())
 
         # Removed the modified header from the check as it was checked above
-        del self.cfixt.headers["User-Agent"]
+        orig_items = {item for item in self.header_items if item[0] != "User-Agent"}
         # Make sure the original headers are still in the internal requests.Session object
-        for head, headdata in self.cfixt.headers.items():
-            self.assertTrue(head in self.client._Client__session.headers)
-            self.assertEqual(self.client._Client__session.headers[head], headdata)
+        self.assertLessEqual(orig_items, self.client._Client__session.headers.items())
 
     def test_not_dictionary(self):
         """Raise an exception when not passed a dictionary."""
@@ -242,6 +249,13 @@ class TestAddHeaders(TestClient):
 class TestRemoveHeaders(TestClient):
     """Test the remove_headers method."""
 
+    def setUp(self):  # pylint: disable=invalid-name
+        """Initialize the class."""
+        # Call the inherited setUp method
+        super().setUp()
+
+        self.restore_headers()
+
     def test_remove(self):
         """Remove headers correctly if passed a list."""
         headers = ["Accept", "customerUri"]
@@ -249,14 +263,11 @@ class TestRemoveHeaders(TestClient):
         self.client.remove_headers(headers)
 
         # Make sure the headers are removed from the requests.Session object
-        for head in headers:
-            self.assertFalse(head in self.client._Client__session.headers)
+        self.assertEqual(self.client._Client__session.headers.keys() & headers, set())
 
         # Make sure the rest of the headers we added before are still there
-        for head, headdata in self.cfixt.headers.items():
-            if head not in headers:
-                self.assertTrue(head in self.client._Client__session.headers)
-                self.assertEqual(self.client._Client__session.headers[head], headdata)
+        kept_items = {item for item in self.header_items if item[0] not in headers}
+        self.assertLessEqual(kept_items, self.client._Client__session.headers.items())
 
     def test_dictionary(self):
         """Remove headers correctly if passed a dictionary."""
@@ -265,282 +276,96 @@ class TestRemoveHeaders(TestClient):
         self.client.remove_headers(headers)
 
         # Make sure the headers are removed from the requests.Session object
-        for head in headers:
-            self.assertFalse(head in self.client._Client__session.headers)
+        self.assertEqual(self.client._Client__session.headers.keys() & headers, set())
 
         # Make sure the rest of the headers we added before are still there
-        for head, headdata in self.cfixt.headers.items():
-            if head not in headers:
-                self.assertTrue(head in self.client._Client__session.headers)
-                self.assertEqual(self.client._Client__session.headers[head], headdata)
-
-
-class TestGet(TestClient):
-    """Test the get method."""
-
-    def setUp(self):  # pylint: disable=invalid-name
-        """Initialize the class."""
-        # Call the inherited setUp method
-        super().setUp()
-
-        # An example URL to use in testing
-        self.test_url = f"{self.cfixt.base_url}/test/url"
-
-    @responses.activate
-    def test_success(self):
-        """Return data correctly if a 200-level status code is returned with data."""
-        # Setup the mocked response
-        json_data = {"some": "data"}
-        responses.add(responses.GET, self.test_url, json=json_data, status=200)
-
-        # Call the function
-        resp = self.client.get(self.test_url)
-
-        # Verify all the query information
-        self.assertEqual(resp.json(), json_data)
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.test_url)
-
-    @responses.activate
-    def test_headers(self):
-        """Add passed headers."""
-        # Setup the mocked response
-        json_data = {"some": "data"}
-        responses.add(responses.GET, self.test_url, json=json_data, status=200)
-
-        # Call the function with extra headers
-        headers = {"newheader": "123"}
-        resp = self.client.get(self.test_url, headers=headers)
-
-        # Verify all the query information
-        self.assertEqual(resp.json(), json_data)
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.test_url)
-
-        for header, hval in headers.items():
-            self.assertTrue(header in responses.calls[0].request.headers)
-            self.assertEqual(hval, responses.calls[0].request.headers[header])
-
-    @responses.activate
-    def test_params(self):
-        """Add passed parameters."""
-        # Setup the mocked response
-        json_data = {"some": "data"}
-        responses.add(responses.GET, self.test_url, json=json_data, status=200,
-                      match_querystring=False)
-
-        # Call the function with extra parameters
-        params = {"key": "value"}
-        resp = self.client.get(self.test_url, params=params)
-        (scheme, netloc, path, query_string, _) = responses.urlsplit(
-            responses.calls[0].request.url)
-        url_plain = responses.urlunsplit((scheme, netloc, path, None, None))
-
-        # Verify all the query information
-        self.assertEqual(resp.json(), json_data)
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(url_plain, self.test_url)
-        query_params = dict(responses.parse_qsl(query_string))
-        # See https://stackoverflow.com/questions/20050913
-        self.assertEqual(query_params, {**params, **query_params})
-
-    @responses.activate
-    def test_failure(self):
-        """Raise an HTTPError exception if an error status code is returned."""
-        # Setup the mocked response
-        json_data = {"description": "some error"}
-        responses.add(responses.GET, self.test_url, json=json_data, status=404)
+        kept_items = {item for item in self.header_items if item[0] not in headers}
+        self.assertLessEqual(kept_items, self.client._Client__session.headers.items())
 
-        # Call the function, expecting an exception
-        self.assertRaises(HTTPError, self.client.get, self.test_url)
 
-        # Still make sure it actually did a query and received a result
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.test_url)
+class TestRequest(TestClient):  # pylint: disable=too-few-public-methods
+    """Serve as a Base class for the tests of the Client methods that make requests."""
 
+    test_url = _TEST_URL
 
-class TestPost(TestClient):
-    """Test the post method."""
 
-    def setUp(self):  # pylint: disable=invalid-name
-        """Initialize the class."""
-        # Call the inherited setUp method
-        super().setUp()
-
-        # An example URL to use in testing
-        self.test_url = f"{self.cfixt.base_url}/test/url"
-
-    @responses.activate
-    def test_success(self):
-        """Return data correctly if a 200-level status code is returned with data."""
-        # Setup the mocked response
-        input_data = {"input": "data"}
-        output_data = {"output": "data"}
-        responses.add(responses.POST, self.test_url, json=output_data, status=200)
-
-        # Call the function
-        resp = self.client.post(self.test_url, data=input_data)
-
-        # Verify all the query information
-        self.assertEqual(resp.json(), output_data)
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.test_url)
-
-    @responses.activate
-    def test_headers(self):
-        """Add passed headers."""
-        # Setup the mocked response
-        input_data = {"input": "data"}
-        output_data = {"output": "data"}
-        responses.add(responses.POST, self.test_url, json=output_data, status=200)
-
-        # Call the function with extra headers
-        headers = {"newheader": "123"}
-        resp = self.client.post(self.test_url, headers=headers, data=input_data)
-
-        # Verify all the query information
-        self.assertEqual(resp.json(), output_data)
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.test_url)
-
-        for header, hval in headers.items():
-            self.assertTrue(header in responses.calls[0].request.headers)
-            self.assertEqual(hval, responses.calls[0].request.headers[header])
-
-    @responses.activate
-    def test_failure(self):
-        """Raise an HTTPError exception if an error status code is returned."""
-        # Setup the mocked response
-        input_data = {"input": "data"}
-        output_data = {"output": "data"}
-        responses.add(responses.POST, self.test_url, json=output_data, status=404)
-
-        # Call the function, expecting an exception
-        self.assertRaises(HTTPError, self.client.post, self.test_url, data=input_data)
-
-        # Still make sure it actually did a query and received a result
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.test_url)
-
-
-class TestPut(TestClient):
-    """Test the put method."""
-
-    def setUp(self):  # pylint: disable=invalid-name
-        """Initialize the class."""
-        # Call the inherited setUp method
-        super().setUp()
+class TestMethods(TestRequest):
+    """Test the get, post, put and delete methods."""
 
-        # An example URL to use in testing
-        self.test_url = f"{self.cfixt.base_url}/test/url"
+    # The Client method, the mocked HTTP method, any extra arguments, and the data and status code
+    # returned on success
+    methods = (
+        ("get", responses.GET, {}, _GET_DATA, 200),
+        ("post", responses.POST, {"data": _INPUT_DATA}, _OUTPUT_DATA, 200),
+        ("put", responses.PUT, {"data": _INPUT_DATA}, _OUTPUT_DATA, 200),
+        ("delete", responses.DELETE, {"data": _INPUT_DATA}, None, 204),
+    )
 
-    @responses.activate
     def test_success(self):
-        """Return data correctly if a 200-level status code is returned with data."""
-        # Setup the mocked response
-        input_data = {"input": "data"}
-        output_data = {"output": "data"}
-        responses.add(responses.PUT, self.test_url, json=output_data, status=200)
+        """Return data correctly if a 200-level status code is returned."""
+        for name, method, kwargs, data, status in self.methods:
+            with self.subTest(method=name):
+                # Setup the mocked response
+                self.rsps.reset()
+                self.rsps.add(method, self.test_url, json=data, status=status)
 
-        # Call the function
-        resp = self.client.put(self.test_url, data=input_data)
+                # Call the function
+                resp = getattr(self.client, name)(self.test_url, **kwargs)
 
-        # Verify all the query information
-        self.assertEqual(resp.json(), output_data)
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.test_url)
+                # Verify all the query information
+                if data is not None:
+                    self.assertEqual(resp.json(), data)
+                self.assertOneCall(self.test_url)
 
-    @responses.activate
     def test_headers(self):
         """Add passed headers."""
-        # Setup the mocked response
-        input_data = {"input": "data"}
-        output_data = {"output": "data"}
-        responses.add(responses.PUT, self.test_url, json=output_data, status=200)
-
-        # Call the function with extra headers
-        headers = {"newheader": "123"}
-        resp = self.client.put(self.test_url, headers=headers, data=input_data)
+        for name, method, kwargs, data, status in self.methods:
+            with self.subTest(method=name):
+                # Setup the mocked response
+                self.rsps.reset()
+                self.rsps.add(method, self.test_url, json=data, status=status)
+
+                # Call the function with extra headers
+                resp = getattr(self.client, name)(self.test_url, headers=_EXTRA_HEADERS, **kwargs)
+
+                # Verify all the query information
+                if data is not None:
+                    self.assertEqual(resp.json(), data)
+                self.assertOneCall(self.test_url)
+                self.assertLessEqual(_EXTRA_HEADERS.items(),
+                                     self.rsps.calls[0].request.headers.items())
 
-        # Verify all the query information
-        self.assertEqual(resp.json(), output_data)
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.test_url)
-
-        for header, hval in headers.items():
-            self.assertTrue(header in responses.calls[0].request.headers)
-            self.assertEqual(hval, responses.calls[0].request.headers[header])
-
-    @responses.activate
     def test_failure(self):
         """Raise an HTTPError exception if an error status code is returned."""
-        # Setup the mocked response
-        input_data = {"input": "data"}
-        output_data = {"output": "data"}
-        responses.add(responses.PUT, self.test_url, json=output_data, status=404)
-
-        # Call the function, expecting an exception
-        self.assertRaises(HTTPError, self.client.put, self.test_url, data=input_data)
-
-        # Still make sure it actually did a query and received a result
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.test_url)
-
-
-class TestDelete(TestClient):
-    """Test the delete method."""
-
-    def setUp(self):  # pylint: disable=invalid-name
-        """Initialize the class."""
-        # Call the inherited setUp method
-        super().setUp()
+        for name, method, kwargs, _, _ in self.methods:
+            with self.subTest(method=name):
+                # Setup the mocked response
+                self.rsps.reset()
+                self.rsps.add(method, self.test_url, json=_ERROR_DATA, status=404)
 
-        # An example URL to use in testing
-        self.test_url = f"{self.cfixt.base_url}/test/url"
+                # Call the function, expecting an exception
+                with self.assertRaises(HTTPError):
+                    getattr(self.client, name)(self.test_url, **kwargs)
 
-    @responses.activate
-    def test_success(self):
-        """Return successful if a 200-level status code is returned."""
-        # Setup the mocked response
-        input_data = {"input": "data"}
-        responses.add(responses.DELETE, self.test_url, status=204)
+                # Still make sure it actually did a query and received a result
+                self.assertOneCall(self.test_url)
 
-        # Call the function
-        self.client.delete(self.test_url, data=input_data)
 
-        # Verify all the query information
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.test_url)
+class TestGet(TestRequest):
+    """Test the parts of the get method the other request methods do not have."""
 
-    @responses.activate
-    def test_headers(self):
-        """Add passed headers."""
+    def test_params(self):
+        """Add passed parameters."""
         # Setup the mocked response
-        input_data = {"input": "data"}
-        responses.add(responses.DELETE, self.test_url, status=204)
+        self.rsps.add(responses.GET, self.test_url, json=_GET_DATA, status=200,
+                      match_querystring=False)
 
-        # Call the function
-        headers = {"newheader": "123"}
-        self.client.delete(self.test_url, headers=headers, data=input_data)
+        # Call the function with extra parameters
+        resp = self.client.get(self.test_url, params={"key": "value"})
+        url = urlsplit(self.rsps.calls[0].request.url)
 
         # Verify all the query information
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.test_url)
-
-        for header, hval in headers.items():
-            self.assertTrue(header in responses.calls[0].request.headers)
-            self.assertEqual(hval, responses.calls[0].request.headers[header])
-
-    @responses.activate
-    def test_failure(self):
-        """Raise an HTTPError exception if a non-200 status code is returned."""
-        # Setup the mocked response
-        input_data = {"input": "data"}
-        responses.add(responses.DELETE, self.test_url, status=404)
-
-        # Call the function, expecting an exception
-        self.assertRaises(HTTPError, self.client.delete, self.test_url, data=input_data)
-
-        # Still make sure it actually did a query and received a result
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.test_url)
+        self.assertEqual(resp.json(), _GET_DATA)
+        self.assertEqual(len(self.rsps.calls), 1)
+        self.assertEqual(url._replace(query="").geturl(), self.test_url)
+        self.assertEqual(parse_qs(url.query), {"key": ["value"]})
@@ -6,52 +6,106 @@
 
 import json
 from http import HTTPStatus
+from types import MappingProxyType
 
 import responses
 from requests.exceptions import HTTPError
-from testtools import TestCase
 
 from cert_manager.dcv import DomainControlValidation
 
-from .lib.testbase import ClientFixture
-
-
-class TestDcv(TestCase):  # pylint: disable=too-few-public-methods
+from .lib.testbase import BASE_URL, ClientTestCase
+
+# The URL of the DCV validation API used by these tests
+_API_URL = f"{BASE_URL}/dcv/v1/validation"
+
+# The search parameters and results used by the search tests, and the successful responses of the
+# validation endpoints; these are read-only MappingProxyType views, so tests can share them, and the
+# mocked responses use the pre-encoded JSON
+_SEARCH_PARAMS = MappingProxyType({
+    "position": 0,
+    "size": 10,
+    "expiresIn": 30,
+    "department": "some_id",
+})
+_SEARCH_RESPONSE = (
+    MappingProxyType({
+        "domain": "*.mydomain.org",
+        "dcvStatus": "VALIDATED",
+        "dcvOrderStatus": "NOT_INITIATED",
+        "dcvMethod": "CNAME",
+        "expirationDate": "2024-03-19",
+    }),
+    MappingProxyType({
+        "domain": "mydomain.org",
+        "dcvStatus": "VALIDATED",
+        "dcvOrderStatus": "NOT_INITIATED",
+        "dcvMethod": "CNAME",
+        "expirationDate": "2024-03-19",
+    }),
+)
+_SEARCH_RESPONSE_JSON = json.dumps([dict(domain) for domain in _SEARCH_RESPONSE]).encode("utf-8")
+
+_STATUS_RESPONSE = MappingProxyType({
+    "status": "EXPIRED",
+    "orderStatus": "SUBMITTED",
+    "expirationDate": "2020-01-14",
+})
+_START_CNAME_RESPONSE = MappingProxyType({
+    "host": "_916d6634d1728d3a8cfbb3f2cc31bdd0.ccmqa.com.",
+    "point": "547a53b84c46e5327bc96cc40832ecc7.7ed2441a319900835df9cfc8326608fd.sectigo.com.",
+})
+_SUBMIT_CNAME_RESPONSE = MappingProxyType({
+    "status": "NOT_VALIDATED",
+    "orderStatus": "SUBMITTED",
+    "message": "DCV status: Not Validated; DCV order status: Submitted",
+})
+_STATUS_RESPONSE_JSON = json.dumps(dict(_STATUS_RESPONSE)).encode("utf-8")
+_START_CNAME_RESPONSE_JSON = json.dumps(dict(_START_CNAME_RESPONSE)).encode("utf-8")
+_SUBMIT_CNAME_RESPONSE_JSON = json.dumps(dict(_SUBMIT_CNAME_RESPONSE)).encode("utf-8")
+
+# JSON to return in an error
+_ERROR_RESPONSE_JSON = json.dumps({"description": "dcv error"}).encode("utf-8")
+
+
+class TestDcv(ClientTestCase):  # pylint: disable=too-few-public-methods
     """Serve as a Base class for all tests of the DomainControlValidation class."""
 
-    def setUp(self):  # pylint: disable=invalid-name
-        """Initialize the class."""
-        # Call the inherited setUp method
-        super().setUp()
+    api_url = _API_URL
+
+    @classmethod
+    def setUpClass(cls):  # pylint: disable=invalid-name
+        """Set up the DomainControlValidation object shared by every test in the class."""
+        # Call the inherited setUpClass method
+        super().setUpClass()
 
-        # Make sure the Client fixture is created and setup
-        self.cfixt = self.useFixture(ClientFixture())
-        self.client = self.cfixt.client
+        # DomainControlValidation keeps no per-call state, so one instance serves the whole class
+        cls.dcv = DomainControlValidation(client=cls.client)
 
-        self.api_url = f"{self.cfixt.base_url}/dcv/v1/validation"
+    def mock_response(self, method, url, body, status=HTTPStatus.OK):
+        """Register a mocked JSON response.
 
-        # Setup JSON to return in an error
-        self.error_response = {"description": "dcv error"}
+        :param str method: The HTTP method to mock, i.e. responses.GET
+        :param str url: The URL to mock
+        :param bytes body: The pre-encoded JSON body to return
+        :param int status: The HTTP status code to return
+        """
+        self.rsps.add(method, url, body=body, content_type="application/json", status=status)
 
 
 class TestInit(TestDcv):
     """Test the class initializer."""
 
-    @responses.activate
     def test_param(self):
         """Change the URL if api_version is passed as a parameter."""
         # Set a new version
         version = "v3"
-        api_url = f"{self.cfixt.base_url}/dcv/{version}/validation?position=0&size=10&expiresIn=30&department=some_id"
+        api_url = (
+            f"{BASE_URL}/dcv/{version}/validation"
+            "?position=0&size=10&expiresIn=30&department=some_id"
+        )
 
         # Setup the mocked response
-        empty_response = "[]"
-        responses.add(
-            responses.GET,
-            api_url,
-            body=empty_response,
-            status=HTTPStatus.OK,
-        )
+        self.mock_response(responses.GET, api_url, b"[]")
 
         dcv = DomainControlValidation(client=self.client, api_version=version)
         data = dcv.search(
@@ -62,8 +116,8 @@ class TestInit(TestDcv):
         )
 
         # Verify all the query information
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, api_url)
+        self.assertEqual(len(self.rsps.calls), 1)
+        self.assertEqual(self.rsps.calls[0].request.url, api_url)
 
         self.assertEqual(data, [])
 
@@ -75,294 +129,85 @@ class TestInit(TestDcv):
 class TestSearch(TestDcv):
     """Test the .all method."""
 
-    def setUp(self):  # pylint: disable=invalid-name
-        """Initialize the class."""
-        # Call the inherited setUp method
-        super().setUp()
-        self.params = {
-            "position": 0,
-            "size": 10,
-            "expiresIn": 30,
-            "department": "some_id",
-        }
-        self.api_url = f"{self.cfixt.base_url}/dcv/v1/validation?position=0&size=10&expiresIn=30&department=some_id"
-        self.valid_response = [
-            {
-                "domain": "*.mydomain.org",
-                "dcvStatus": "VALIDATED",
-                "dcvOrderStatus": "NOT_INITIATED",
-                "dcvMethod": "CNAME",
-                "expirationDate": "2024-03-19",
-            },
-            {
-                "domain": "mydomain.org",
-                "dcvStatus": "VALIDATED",
-                "dcvOrderStatus": "NOT_INITIATED",
-                "dcvMethod": "CNAME",
-                "expirationDate": "2024-03-19",
-            },
-        ]
-
-    @responses.activate
+    params = _SEARCH_PARAMS
+    api_url = f"{_API_URL}?position=0&size=10&expiresIn=30&department=some_id"
+    valid_response = _SEARCH_RESPONSE
+
     def test_search(self):
         """Return all the data, but it should query the API twice."""
         # Setup the mocked response
-        responses.add(
-            responses.GET, self.api_url, json=self.valid_response, status=HTTPStatus.OK
-        )
+        self.mock_response(responses.GET, self.api_url, _SEARCH_RESPONSE_JSON)
 
-        dcv = DomainControlValidation(client=self.client)
-        data = dcv.search(**self.params)
+        data = self.dcv.search(**self.params)
 
         # Verify all the query information
         # There should only be one call the first time "all" is called.
         # Due to pagination, this is only guaranteed as long as the number of
         # entries returned is less than the page size
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.api_url)
-        self.assertEqual(data, self.valid_response)
+        self.assertEqual(len(self.rsps.calls), 1)
+        self.assertEqual(self.rsps.calls[0].request.url, self.api_url)
+        self.assertSequenceEqual(data, self.valid_response)
 
-    @responses.activate
     def test_bad_http(self):
         """Raise an exception if domains cannot be retrieved from the API."""
         # Setup the mocked response
-        responses.add(
-            responses.GET,
-            self.api_url,
-            json=self.error_response,
-            status=HTTPStatus.BAD_REQUEST,
-        )
+        self.mock_response(responses.GET, self.api_url, _ERROR_RESPONSE_JSON,
+                           HTTPStatus.BAD_REQUEST)
 
-        domain = DomainControlValidation(client=self.client)
-        self.assertRaises(HTTPError, domain.search, **self.params)
+        self.assertRaises(HTTPError, self.dcv.search, **self.params)
 
         # Verify all the query information
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.api_url)
-
+        self.assertEqual(len(self.rsps.calls), 1)
+        self.assertEqual(self.rsps.calls[0].request.url, self.api_url)
+
+
+class TestValidation(TestDcv):
+    """Test the validation methods that send a domain."""
+
+    # The URL, method and successful response (decoded and encoded) for each validation endpoint
+    # that sends a domain
+    endpoints = (
+        (f"{_API_URL}/status", "get_validation_status", _STATUS_RESPONSE, _STATUS_RESPONSE_JSON),
+        (f"{_API_URL}/start/domain/cname", "start_validation_cname", _START_CNAME_RESPONSE,
+         _START_CNAME_RESPONSE_JSON),
+        (f"{_API_URL}/submit/domain/cname", "submit_validation_cname", _SUBMIT_CNAME_RESPONSE,
+         _SUBMIT_CNAME_RESPONSE_JSON),
+    )
+
+    # A 400 error is turned into a ValueError with the API's description, while other errors are
+    # raised as is
+    errors = (
+        (HTTPStatus.BAD_REQUEST, ValueError),
+        (HTTPStatus.INTERNAL_SERVER_ERROR, HTTPError),
+    )
 
-class TestGetValidationStatus(TestDcv):
-    """Test the .all method."""
-
-    def setUp(self):  # pylint: disable=invalid-name
-        """Initialize the class."""
-        # Call the inherited setUp method
-        super().setUp()
-        self.params = {
-            "domain": "mydomain.org",
-        }
-        self.api_url = f"{self.cfixt.base_url}/dcv/v1/validation/status"
-        self.valid_response = {
-            "status": "EXPIRED",
-            "orderStatus": "SUBMITTED",
-            "expirationDate": "2020-01-14",
-        }
-
-    @responses.activate
     def test_success(self):
-        """Return all the data, but it should query the API twice."""
-        # Setup the mocked response
-        responses.add(
-            responses.POST, self.api_url, json=self.valid_response, status=HTTPStatus.OK
-        )
-
-        dcv = DomainControlValidation(client=self.client)
-        data = dcv.get_validation_status(**self.params)
-
-        # Verify all the query information
-        # There should only be one call the first time "all" is called.
-        # Due to pagination, this is only guaranteed as long as the number of
-        # entries returned is less than the page size
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.api_url)
-        self.assertEqual(
-            json.loads(responses.calls[0].request.body)["domain"], "mydomain.org"
-        )
-        self.assertEqual(data, self.valid_response)
-
-    @responses.activate
-    def test_bad_req(self):
-        """Raise an exception if domains cannot be retrieved from the API."""
-        # Setup the mocked response
-        responses.add(
-            responses.POST,
-            self.api_url,
-            json=self.error_response,
-            status=HTTPStatus.BAD_REQUEST,
-        )
-
-        domain = DomainControlValidation(client=self.client)
-        self.assertRaises(ValueError, domain.get_validation_status, **self.params)
-
-        # Verify all the query information
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.api_url)
-
-    @responses.activate
-    def test_server_error(self):
-        """Raise an exception if domains cannot be retrieved from the API."""
-        # Setup the mocked response
-        responses.add(
-            responses.POST,
-            self.api_url,
-            json=self.error_response,
-            status=HTTPStatus.INTERNAL_SERVER_ERROR,
-        )
-
-        domain = DomainControlValidation(client=self.client)
-        self.assertRaises(HTTPError, domain.get_validation_status, **self.params)
-
-        # Verify all the query information
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.api_url)
-
-
-class TestStartValidationCname(TestDcv):
-    """Test the .all method."""
-
-    def setUp(self):  # pylint: disable=invalid-name
-        """Initialize the class."""
-        # Call the inherited setUp method
-        super().setUp()
-        self.params = {
-            "domain": "mydomain.org",
-        }
-        self.api_url = f"{self.cfixt.base_url}/dcv/v1/validation/start/domain/cname"
-        self.valid_response = {
-            "host": "_916d6634d1728d3a8cfbb3f2cc31bdd0.ccmqa.com.",
-            "point": "547a53b84c46e5327bc96cc40832ecc7.7ed2441a319900835df9cfc8326608fd.sectigo.com.",
-        }
-
-    @responses.activate
-    def test_success(self):
-        """Return all the data, but it should query the API twice."""
-        # Setup the mocked response
-        responses.add(
-            responses.POST, self.api_url, json=self.valid_response, status=HTTPStatus.OK
-        )
-
-        dcv = DomainControlValidation(client=self.client)
-        data = dcv.start_validation_cname(**self.params)
-
-        # Verify all the query information
-        # There should only be one call the first time "all" is called.
-        # Due to pagination, this is only guaranteed as long as the number of
-        # entries returned is less than the page size
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.api_url)
-        self.assertEqual(
-            json.loads(responses.calls[0].request.body)["domain"], "mydomain.org"
-        )
-        self.assertEqual(data, self.valid_response)
-
-    @responses.activate
-    def test_bad_req(self):
-        """Raise an exception if domains cannot be retrieved from the API."""
-        # Setup the mocked response
-        responses.add(
-            responses.POST,
-            self.api_url,
-            json=self.error_response,
-            status=HTTPStatus.BAD_REQUEST,
-        )
-
-        domain = DomainControlValidation(client=self.client)
-        self.assertRaises(ValueError, domain.start_validation_cname, **self.params)
-
-        # Verify all the query information
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.api_url)
-
-    @responses.activate
-    def test_server_error(self):
-        """Raise an exception if domains cannot be retrieved from the API."""
-        # Setup the mocked response
-        responses.add(
-            responses.POST,
-            self.api_url,
-            json=self.error_response,
-            status=HTTPStatus.INTERNAL_SERVER_ERROR,
-        )
-
-        domain = DomainControlValidation(client=self.client)
-        self.assertRaises(HTTPError, domain.start_validation_cname, **self.params)
-
-        # Verify all the query information
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.api_url)
-
-
-class TestSubmitValidationCname(TestDcv):
-    """Test the .all method."""
-
-    def setUp(self):  # pylint: disable=invalid-name
-        """Initialize the class."""
-        # Call the inherited setUp method
-        super().setUp()
-        self.params = {
-            "domain": "mydomain.org",
-        }
-        self.api_url = f"{self.cfixt.base_url}/dcv/v1/validation/submit/domain/cname"
-        self.valid_response = {
-            "status": "NOT_VALIDATED",
-            "orderStatus": "SUBMITTED",
-            "message": "DCV status: Not Validated; DCV order status: Submitted",
-        }
-
-    @responses.activate
-    def test_success(self):
-        """Return all the data, but it should query the API twice."""
-        # Setup the mocked response
-        responses.add(
-            responses.POST, self.api_url, json=self.valid_response, status=HTTPStatus.OK
-        )
-
-        dcv = DomainControlValidation(client=self.client)
-        data = dcv.submit_validation_cname(**self.params)
-
-        # Verify all the query information
-        # There should only be one call the first time "all" is called.
-        # Due to pagination, this is only guaranteed as long as the number of
-        # entries returned is less than the page size
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.api_url)
-        self.assertEqual(
-            json.loads(responses.calls[0].request.body)["domain"], "mydomain.org"
-        )
-        self.assertEqual(data, self.valid_response)
-
-    @responses.activate
-    def test_bad_req(self):
-        """Raise an exception if domains cannot be retrieved from the API."""
-        # Setup the mocked response
-        responses.add(
-            responses.POST,
-            self.api_url,
-            json=self.error_response,
-            status=HTTPStatus.BAD_REQUEST,
-        )
-
-        domain = DomainControlValidation(client=self.client)
-        self.assertRaises(ValueError, domain.submit_validation_cname, **self.params)
-
-        # Verify all the query information
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.api_url)
-
-    @responses.activate
-    def test_server_error(self):
-        """Raise an exception if domains cannot be retrieved from the API."""
-        # Setup the mocked response
-        responses.add(
-            responses.POST,
-            self.api_url,
-            json=self.error_response,
-            status=HTTPStatus.INTERNAL_SERVER_ERROR,
-        )
-
-        domain = DomainControlValidation(client=self.client)
-        self.assertRaises(HTTPError, domain.submit_validation_cname, **self.params)
-
-        # Verify all the query information
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, self.api_url)
+        """Return the response data and send the domain in the request body."""
+        for api_url, method, valid_response, valid_response_json in self.endpoints:
+            with self.subTest(method=method):
+                # Setup the mocked response
+                self.rsps.reset()
+                self.mock_response(responses.POST, api_url, valid_response_json)
+
+                data = getattr(self.dcv, method)(domain="mydomain.org")
+
+                # Verify all the query information
+                self.assertEqual(len(self.rsps.calls), 1)
+                self.assertEqual(self.rsps.calls[0].request.url, api_url)
+                self.assertJsonBody(self.rsps.calls[0], {"domain": "mydomain.org"})
+                self.assertEqual(data, valid_response)
+
+    def test_error(self):
+        """Raise an exception if the validation request fails."""
+        for api_url, method, _, _ in self.endpoints:
+            for status, exception in self.errors:
+                with self.subTest(method=method, status=status):
+                    # Setup the mocked response
+                    self.rsps.reset()
+                    self.mock_response(responses.POST, api_url, _ERROR_RESPONSE_JSON, status)
+
+                    self.assertRaises(exception, getattr(self.dcv, method), domain="mydomain.org")
+
+                    # Verify all the query information
+                    self.assertEqual(len(self.rsps.calls), 1)
+                    self.assertEqual(self.rsps.calls[0].request.url, api_url)
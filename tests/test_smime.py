@@ -12,8 +12,7 @@ from testtools import TestCase
 from cert_manager._helpers import PendingError, RevokedError
 from cert_manager.smime import SMIME
 
-from .lib.testbase import ClientFixture
-from .test_certificates import TestCertificates
+from .lib.testbase import FAKE_CERT, FAKE_CSR, ClientFixture
 
 
 # pylint: disable=too-few-public-methods
@@ -179,7 +178,7 @@ class TestEnroll(TestSMIME):
         self.test_cf = [{"name": "testName", "value": "testValue"}]
 
         self.test_url = f"{self.api_url}/enroll"
-        self.test_csr = TestCertificates.fake_csr()
+        self.test_csr = FAKE_CSR
 
         self.test_result = json.dumps({"orderNumber": 123456, "backendCertId": "123456"})
 
@@ -264,7 +263,8 @@ class TestEnroll(TestSMIME):
         # We need to mock the /types and /customFields URLs as well
         # since Certificates.types and Certificate.custom_fields are called from enroll
         responses.add(responses.GET, self.test_types_url, json=self.types_data, status=200)
-        responses.add(responses.GET, self.test_customfields_url, json=self.cf_data_mandatory, status=200)
+        responses.add(responses.GET, self.test_customfields_url, json=self.cf_data_mandatory,
+                      status=200)
 
         responses.add(responses.POST, self.test_url, json=self.test_result, status=200)
 
@@ -294,7 +294,7 @@ class TestCollect(TestSMIME):
         self.test_id = 121212
         self.test_url = f"{self.api_url}/collect/{self.test_id}"
 
-        self.test_cert = TestCertificates.fake_cert()
+        self.test_cert = FAKE_CERT
 
     def test_defaults(self):
         """Raise an exception when no certificate id is passed."""
@@ -438,7 +438,7 @@ class TestReplace(TestSMIME):
         self.api_version = "v2"     # this endpoint is in v2
         self.api_url = f"{self.cfixt.base_url}{self.ep_path}/{self.api_version}"
         self.test_url = f"{self.api_url}/replace/order/{self.test_cert_id}"
-        self.test_csr = TestCertificates.fake_csr()
+        self.test_csr = FAKE_CSR
 
     def test_defaults(self):
         """Raise an exception when no params are passed."""